@@ -17,6 +17,7 @@ from llama_index.core.base.llms.types import (
     TextBlock,
     ToolCallBlock,
 )
+from llama_index.core.bridge.pydantic import PrivateAttr
 from llama_index.core.llms.callbacks import llm_chat_callback, llm_completion_callback
 from llama_index.core.llms.function_calling import FunctionCallingLLM
 from llama_index.core.llms.llm import ToolSelection
@@ -40,6 +41,9 @@ except Exception:
     # Fallback if package is not installed (e.g., during development)
     PACKAGE_VERSION = "0.0.0"
 
+# Fields baked into the Gradient clients; assigning any of them drops cached clients
+_CLIENT_FIELDS = frozenset({"model_access_key", "base_url", "timeout"})
+
 
 def _resolve_tool_choice(
     tool_choice: Optional[Union[str, dict]], tool_required: bool = False
@@ -90,6 +94,9 @@ class GradientAI(FunctionCallingLLM):
     timeout: float = 60.0
     is_function_calling_model: bool = True
 
+    _sync_client_instance: Optional[Gradient] = PrivateAttr(default=None)
+    _async_client_instance: Optional[AsyncGradient] = PrivateAttr(default=None)
+
     def __init__(
         self,
         model: str,
@@ -135,6 +142,50 @@ class GradientAI(FunctionCallingLLM):
             **kwargs,
         )
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _CLIENT_FIELDS:
+            self._reset_clients()
+
+    def __copy__(self) -> "GradientAI":
+        copied = super().__copy__()
+        # Copies (including model_copy(update=...)) build their own clients
+        copied._reset_clients()
+        return copied
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "GradientAI":
+        memo = {} if memo is None else memo
+        # Cached clients hold locks and connection pools that cannot be copied;
+        # mapping them to None in a local memo makes the copy start without clients
+        # without affecting other references to them in the caller's copy graph.
+        client_ids = {
+            id(client)
+            for client in (self._sync_client_instance, self._async_client_instance)
+            if client is not None
+        }
+        local_memo = dict(memo)
+        local_memo.update(dict.fromkeys(client_ids))
+        copied = super().__deepcopy__(local_memo)
+        for key, value in local_memo.items():
+            if key not in client_ids:
+                memo.setdefault(key, value)
+        return copied
+
+    def _get_client_kwargs(self) -> Dict[str, Any]:
+        """Client settings shared by the sync and async Gradient clients."""
+        return {
+            "model_access_key": self.model_access_key,
+            "base_url": self.base_url,
+            "timeout": self.timeout,
+            "user_agent_package": PACKAGE_NAME,
+            "user_agent_version": PACKAGE_VERSION,
+        }
+
+    def _reset_clients(self) -> None:
+        """Drop cached clients so they are rebuilt from the current settings."""
+        self._sync_client_instance = None
+        self._async_client_instance = None
+
     @property
     def metadata(self) -> LLMMetadata:
         return LLMMetadata(
@@ -146,25 +197,17 @@ class GradientAI(FunctionCallingLLM):
 
     @property
     def _client(self) -> Gradient:
-        """Synchronous Gradient client."""
-        return Gradient(
-            model_access_key=self.model_access_key,
-            base_url=self.base_url,
-            timeout=self.timeout,
-            user_agent_package=PACKAGE_NAME,
-            user_agent_version=PACKAGE_VERSION,
-        )
+        """Synchronous Gradient client, created on first access and reused."""
+        if self._sync_client_instance is None:
+            self._sync_client_instance = Gradient(**self._get_client_kwargs())
+        return self._sync_client_instance
 
     @property
     def _async_client(self) -> AsyncGradient:
-        """Asynchronous Gradient client."""
-        return AsyncGradient(
-            model_access_key=self.model_access_key,
-            base_url=self.base_url,
-            timeout=self.timeout,
-            user_agent_package=PACKAGE_NAME,
-            user_agent_version=PACKAGE_VERSION,
-        )
+        """Asynchronous Gradient client, created on first access and reused."""
+        if self._async_client_instance is None:
+            self._async_client_instance = AsyncGradient(**self._get_client_kwargs())
+        return self._async_client_instance
 
     def _format_messages(self, messages: Sequence[ChatMessage]) -> List[Dict[str, Any]]:
         """Format messages for Gradient API (OpenAI-compatible format)."""
@@ -9,6 +9,9 @@ from llama_index.llms.digitalocean.gradientai import GradientAI
 load_dotenv()
 REQUIRED_ENV = "MODEL_ACCESS_KEY"
 
+# Every test here calls the live Gradient API; excluded from the default run.
+pytestmark = pytest.mark.slow
+
 
 # Tool functions for function calling tests
 def add(a: int, b: int) -> int:
@@ -5,337 +5,355 @@ parameters (package name and version) are correctly passed to both sync and asyn
 Gradient clients.
 """
 
-from unittest.mock import MagicMock, patch
+import copy
+import re
+from functools import lru_cache
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
+from gradient import AsyncGradient, Gradient
+from llama_index.core.base.llms.types import ChatMessage
 
 from llama_index.llms.digitalocean.gradientai import GradientAI
 from llama_index.llms.digitalocean.gradientai.base import PACKAGE_NAME, PACKAGE_VERSION
 
+# Keep this module on one worker under pytest-xdist's loadgroup scheduler so the
+# cached _build_llm prototypes are reused instead of rebuilt per worker.
+pytestmark = pytest.mark.xdist_group("user_agent")
 
-class TestUserAgentConfiguration:
-    """Tests verifying user agent information is correctly configured."""
-
-    def test_package_name_constant(self):
-        """Test that PACKAGE_NAME constant is correctly set."""
-        assert PACKAGE_NAME == "llama-index-llms-digitalocean-gradientai"
+BASE_MODULE = "llama_index.llms.digitalocean.gradientai.base"
 
-    def test_package_version_is_set(self):
-        """Test that PACKAGE_VERSION is a valid version string."""
-        # PACKAGE_VERSION should be a string like "0.1.1" or "0.0.0" in dev
-        assert isinstance(PACKAGE_VERSION, str)
-        assert len(PACKAGE_VERSION) > 0
-        # Version should contain at least one dot (e.g., "0.1.1" or "0.0.0")
-        assert "." in PACKAGE_VERSION
-
-    def test_package_version_format(self):
-        """Test that PACKAGE_VERSION follows semantic versioning format."""
-        parts = PACKAGE_VERSION.split(".")
-        # Should have at least major.minor format
-        assert len(parts) >= 2
-        # Each part should be numeric
-        for part in parts:
-            # Handle pre-release versions like "0.1.1a1"
-            numeric_part = "".join(c for c in part if c.isdigit())
-            assert len(numeric_part) > 0, f"Version part '{part}' should contain digits"
-
-
-class TestSyncClientUserAgent:
-    """Tests for synchronous Gradient client user agent configuration."""
-
-    @patch("llama_index.llms.digitalocean.gradientai.base.Gradient")
-    def test_sync_client_receives_user_agent_params(self, mock_gradient_class):
-        """Test that sync Gradient client is created with user agent parameters."""
-        # Arrange
-        mock_client = MagicMock()
-        mock_gradient_class.return_value = mock_client
+# major.minor[.patch] with optional PEP 440 style suffixes such as "a1", "rc2" or ".dev3"
+_SEMVER_RE = re.compile(r"\A\d+\.\d+(?:\.\d+)?(?:\.?[A-Za-z]+\d+)*\Z")
 
-        llm = GradientAI(
-            model="test-model",
-            model_access_key="test-key",
+# Minimal stand-in for a chat completion response, shared by the API call tests.
+_FAKE_RESPONSE = SimpleNamespace(
+    choices=[
+        SimpleNamespace(
+            message=SimpleNamespace(content="Test response", role="assistant", tool_calls=None)
         )
+    ]
+)
 
-        # Act - access the _client property to trigger client creation
-        _ = llm._client
 
-        # Assert
-        mock_gradient_class.assert_called_once()
-        call_kwargs = mock_gradient_class.call_args.kwargs
+async def _fake_create(**_):
+    """Async replacement for ``chat.completions.create`` returning ``_FAKE_RESPONSE``."""
+    return _FAKE_RESPONSE
+
+
+def _assert_ua(client_kwargs):
+    """Assert that client constructor kwargs carry this package's user agent."""
+    package = client_kwargs.get("user_agent_package")
+    version = client_kwargs.get("user_agent_version")
+    assert package == PACKAGE_NAME, f"user_agent_package {package!r} != {PACKAGE_NAME!r}"
+    assert version == PACKAGE_VERSION, f"user_agent_version {version!r} != {PACKAGE_VERSION!r}"
+
+
+class _RecordingFactory:
+    """Stand-in for a Gradient SDK client class that records constructor kwargs."""
+
+    def __init__(self, spec):
+        self.calls = []
+        self.client = MagicMock(spec=spec)
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.client
+
+
+@pytest.fixture
+def patched_gradient(monkeypatch):
+    """Replace the Gradient and AsyncGradient classes with recording factories.
+
+    Returns a ``(gradient_factory, async_gradient_factory)`` tuple; each factory's
+    ``calls`` list holds the kwargs every client was constructed with and
+    ``client`` is the spec'd mock it hands out.
+    """
+    gradient_factory = _RecordingFactory(Gradient)
+    async_gradient_factory = _RecordingFactory(AsyncGradient)
+    monkeypatch.setattr(f"{BASE_MODULE}.Gradient", gradient_factory)
+    monkeypatch.setattr(f"{BASE_MODULE}.AsyncGradient", async_gradient_factory)
+    return gradient_factory, async_gradient_factory
+
+
+@lru_cache(maxsize=None)
+def _build_llm(**kwargs):
+    """Build (and cache per kwargs) a validated GradientAI prototype."""
+    return GradientAI(model="test-model", model_access_key="test-key", **kwargs)
+
+
+@pytest.fixture
+def make_llm():
+    """Return a factory producing GradientAI instances for the given kwargs.
 
-        assert "user_agent_package" in call_kwargs
-        assert call_kwargs["user_agent_package"] == PACKAGE_NAME
+    Pydantic validation runs once per distinct kwargs; each test gets its own
+    ``model_copy()`` so lazily cached clients never leak between tests.
+    """
 
-        assert "user_agent_version" in call_kwargs
-        assert call_kwargs["user_agent_version"] == PACKAGE_VERSION
+    def _make_llm(**kwargs):
+        return _build_llm(**kwargs).model_copy()
 
-    @patch("llama_index.llms.digitalocean.gradientai.base.Gradient")
-    def test_sync_client_user_agent_with_custom_config(self, mock_gradient_class):
+    return _make_llm
+
+
+@pytest.fixture
+def default_llm(make_llm):
+    """GradientAI instance built with the default test model and key."""
+    return make_llm()
+
+
+class TestUserAgentConfiguration:
+    """Tests verifying user agent information is correctly configured."""
+
+    @pytest.mark.parametrize(
+        "value,check",
+        [
+            (PACKAGE_NAME, lambda s: s == "llama-index-llms-digitalocean-gradientai"),
+            (PACKAGE_VERSION, lambda s: isinstance(s, str) and "." in s),
+            (PACKAGE_VERSION, _SEMVER_RE.match),
+        ],
+        ids=["PACKAGE_NAME", "PACKAGE_VERSION_type", "PACKAGE_VERSION_semver"],
+    )
+    def test_package_constants(self, value, check):
+        """Test that PACKAGE_NAME and PACKAGE_VERSION (e.g. "0.1.1" or "0.0.0") are valid."""
+        assert check(value), f"Unexpected constant value: {value!r}"
+
+
+# Parametrizes a test over the sync and async client properties; ``client_index``
+# selects the matching recording factory from the ``patched_gradient`` tuple.
+_CLIENT_PARAMS = pytest.mark.parametrize(
+    "client_attr,client_index",
+    [("_client", 0), ("_async_client", 1)],
+    ids=["sync", "async"],
+)
+
+
+class TestClientUserAgent:
+    """Tests for sync and async Gradient client user agent configuration."""
+
+    @_CLIENT_PARAMS
+    def test_client_receives_user_agent_params(
+        self, patched_gradient, default_llm, client_attr, client_index
+    ):
+        """Test that the Gradient client is created with user agent parameters."""
+        client_factory = patched_gradient[client_index]
+
+        # Act - access the client property to trigger client creation
+        _ = getattr(default_llm, client_attr)
+
+        # Assert
+        assert len(client_factory.calls) == 1
+        _assert_ua(client_factory.calls[0])
+
+    @_CLIENT_PARAMS
+    def test_client_user_agent_with_custom_config(
+        self, patched_gradient, make_llm, client_attr, client_index
+    ):
         """Test that user agent is passed even with custom base_url and timeout."""
+        client_factory = patched_gradient[client_index]
         # Arrange
-        mock_client = MagicMock()
-        mock_gradient_class.return_value = mock_client
-
-        llm = GradientAI(
-            model="test-model",
-            model_access_key="test-key",
+        llm = make_llm(
             base_url="https://custom.api.com",
             timeout=120.0,
         )
 
         # Act
-        _ = llm._client
+        _ = getattr(llm, client_attr)
 
         # Assert
-        call_kwargs = mock_gradient_class.call_args.kwargs
+        call_kwargs = client_factory.calls[-1]
 
         # Verify all expected parameters are passed
         assert call_kwargs["model_access_key"] == "test-key"
         assert call_kwargs["base_url"] == "https://custom.api.com"
         assert call_kwargs["timeout"] == 120.0
-        assert call_kwargs["user_agent_package"] == PACKAGE_NAME
-        assert call_kwargs["user_agent_version"] == PACKAGE_VERSION
+        _assert_ua(call_kwargs)
 
-    @patch("llama_index.llms.digitalocean.gradientai.base.Gradient")
-    def test_sync_client_creates_new_instance_each_access(self, mock_gradient_class):
-        """Test that _client property creates a new client instance each time."""
-        # Arrange
-        mock_client1 = MagicMock()
-        mock_client2 = MagicMock()
-        mock_gradient_class.side_effect = [mock_client1, mock_client2]
+    @_CLIENT_PARAMS
+    def test_client_reuses_instance_across_access(
+        self, patched_gradient, default_llm, client_attr, client_index
+    ):
+        """Test that the client property creates the client once and reuses it."""
+        client_factory = patched_gradient[client_index]
 
-        llm = GradientAI(
-            model="test-model",
-            model_access_key="test-key",
-        )
+        # Act - access the client property twice
+        first = getattr(default_llm, client_attr)
+        second = getattr(default_llm, client_attr)
+
+        # Assert - the client should be constructed only once and the instance reused
+        assert first is second
+        assert first is client_factory.client
 
-        # Act - access _client twice
-        _ = llm._client
-        _ = llm._client
+        # The single call should have user agent params
+        assert len(client_factory.calls) == 1
+        _assert_ua(client_factory.calls[0])
 
-        # Assert - Gradient() should be called twice
-        assert mock_gradient_class.call_count == 2
 
-        # Both calls should have user agent params
-        for call in mock_gradient_class.call_args_list:
-            call_kwargs = call.kwargs
-            assert call_kwargs["user_agent_package"] == PACKAGE_NAME
-            assert call_kwargs["user_agent_version"] == PACKAGE_VERSION
+class TestClientCaching:
+    """Tests for invalidation and copying of the cached Gradient clients."""
 
+    @_CLIENT_PARAMS
+    @pytest.mark.parametrize(
+        "field,value",
+        [("model_access_key", "new-key"), ("base_url", "https://new.api.com"), ("timeout", 5.0)],
+    )
+    def test_client_rebuilt_after_config_change(
+        self, patched_gradient, default_llm, client_attr, client_index, field, value
+    ):
+        """Test that assigning a connection field drops the cached client."""
+        client_factory = patched_gradient[client_index]
+        _ = getattr(default_llm, client_attr)
 
-class TestAsyncClientUserAgent:
-    """Tests for asynchronous Gradient client user agent configuration."""
+        setattr(default_llm, field, value)
+        _ = getattr(default_llm, client_attr)
 
-    @patch("llama_index.llms.digitalocean.gradientai.base.AsyncGradient")
-    def test_async_client_receives_user_agent_params(self, mock_async_gradient_class):
-        """Test that async Gradient client is created with user agent parameters."""
-        # Arrange
-        mock_client = MagicMock()
-        mock_async_gradient_class.return_value = mock_client
+        assert len(client_factory.calls) == 2
 
-        llm = GradientAI(
-            model="test-model",
-            model_access_key="test-key",
-        )
+    @_CLIENT_PARAMS
+    def test_client_receives_updated_config(
+        self, patched_gradient, default_llm, client_attr, client_index
+    ):
+        """Test that a client rebuilt after a config change gets the new settings."""
+        client_factory = patched_gradient[client_index]
+        _ = getattr(default_llm, client_attr)
+
+        default_llm.base_url = "https://new.api.com"
+        default_llm.timeout = 5.0
+        _ = getattr(default_llm, client_attr)
+
+        call_kwargs = client_factory.calls[-1]
+        assert call_kwargs["base_url"] == "https://new.api.com"
+        assert call_kwargs["timeout"] == 5.0
+        _assert_ua(call_kwargs)
+
+    @_CLIENT_PARAMS
+    def test_model_copy_update_uses_new_config(
+        self, patched_gradient, default_llm, client_attr, client_index
+    ):
+        """Test that model_copy(update=...) builds its client from the updated fields."""
+        client_factory = patched_gradient[client_index]
+        original = getattr(default_llm, client_attr)
 
-        # Act - access the _async_client property
-        _ = llm._async_client
+        copied = default_llm.model_copy(update={"model_access_key": "copied-key"})
+        _ = getattr(copied, client_attr)
 
-        # Assert
-        mock_async_gradient_class.assert_called_once()
-        call_kwargs = mock_async_gradient_class.call_args.kwargs
+        assert len(client_factory.calls) == 2
+        assert client_factory.calls[-1]["model_access_key"] == "copied-key"
+        assert getattr(default_llm, client_attr) is original
 
-        assert "user_agent_package" in call_kwargs
-        assert call_kwargs["user_agent_package"] == PACKAGE_NAME
+    @_CLIENT_PARAMS
+    def test_model_construct_client_gets_config(self, patched_gradient, client_attr, client_index):
+        """Test that instances built without validation still pass key and user agent."""
+        client_factory = patched_gradient[client_index]
+        llm = GradientAI.model_construct(model="test-model", model_access_key="test-key")
 
-        assert "user_agent_version" in call_kwargs
-        assert call_kwargs["user_agent_version"] == PACKAGE_VERSION
+        _ = getattr(llm, client_attr)
 
-    @patch("llama_index.llms.digitalocean.gradientai.base.AsyncGradient")
-    def test_async_client_user_agent_with_custom_config(self, mock_async_gradient_class):
-        """Test that async client passes user agent with custom configuration."""
-        # Arrange
-        mock_client = MagicMock()
-        mock_async_gradient_class.return_value = mock_client
-
-        llm = GradientAI(
-            model="test-model",
-            model_access_key="test-key",
-            base_url="https://async.custom.api.com",
-            timeout=90.0,
-        )
+        assert client_factory.calls[-1]["model_access_key"] == "test-key"
+        _assert_ua(client_factory.calls[-1])
 
-        # Act
-        _ = llm._async_client
+    def test_unrelated_field_change_keeps_client(self, patched_gradient, default_llm):
+        """Test that assigning a non-connection field keeps the cached client."""
+        gradient_factory, _ = patched_gradient
+        _ = default_llm._client
 
-        # Assert
-        call_kwargs = mock_async_gradient_class.call_args.kwargs
+        default_llm.temperature = 0.1
+        _ = default_llm._client
 
-        # Verify all expected parameters are passed
-        assert call_kwargs["model_access_key"] == "test-key"
-        assert call_kwargs["base_url"] == "https://async.custom.api.com"
-        assert call_kwargs["timeout"] == 90.0
-        assert call_kwargs["user_agent_package"] == PACKAGE_NAME
-        assert call_kwargs["user_agent_version"] == PACKAGE_VERSION
-
-    @patch("llama_index.llms.digitalocean.gradientai.base.AsyncGradient")
-    def test_async_client_creates_new_instance_each_access(self, mock_async_gradient_class):
-        """Test that _async_client property creates a new client instance each time."""
-        # Arrange
-        mock_client1 = MagicMock()
-        mock_client2 = MagicMock()
-        mock_async_gradient_class.side_effect = [mock_client1, mock_client2]
+        assert len(gradient_factory.calls) == 1
 
-        llm = GradientAI(
-            model="test-model",
-            model_access_key="test-key",
-        )
+    @pytest.mark.parametrize(
+        "copier",
+        [copy.copy, copy.deepcopy, lambda llm: llm.model_copy()],
+        ids=["copy", "deepcopy", "model_copy"],
+    )
+    def test_copy_after_use_starts_without_clients(self, default_llm, copier):
+        """Test that copies of a used LLM rebuild their own real SDK clients."""
+        sync_client = default_llm._client
+        async_client = default_llm._async_client
+
+        copied = copier(default_llm)
 
-        # Act - access _async_client twice
-        _ = llm._async_client
-        _ = llm._async_client
+        assert copied._client is not sync_client
+        assert copied._async_client is not async_client
+        assert default_llm._client is sync_client
 
-        # Assert - AsyncGradient() should be called twice
-        assert mock_async_gradient_class.call_count == 2
+    def test_deepcopy_keeps_other_references_to_client(self, default_llm):
+        """Test that deepcopy only drops the LLM's own reference to a cached client."""
+        client = SimpleNamespace(name="client")
+        default_llm._sync_client_instance = client
 
-        # Both calls should have user agent params
-        for call in mock_async_gradient_class.call_args_list:
-            call_kwargs = call.kwargs
-            assert call_kwargs["user_agent_package"] == PACKAGE_NAME
-            assert call_kwargs["user_agent_version"] == PACKAGE_VERSION
+        copied = copy.deepcopy({"llm": default_llm, "client": client})
+
+        assert copied["llm"]._sync_client_instance is None
+        assert isinstance(copied["client"], SimpleNamespace)
+        assert copied["client"].name == "client"
 
 
 class TestUserAgentInApiCalls:
     """Tests verifying user agent is passed when making actual API calls."""
 
-    @patch("llama_index.llms.digitalocean.gradientai.base.Gradient")
-    def test_user_agent_passed_during_complete(self, mock_gradient_class):
+    def test_user_agent_passed_during_complete(self, patched_gradient, default_llm):
         """Test that user agent is configured when complete() is called."""
+        gradient_factory, _ = patched_gradient
         # Arrange
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Test response"
-
-        mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_gradient_class.return_value = mock_client
-
-        llm = GradientAI(
-            model="test-model",
-            model_access_key="test-key",
-        )
+        gradient_factory.client.chat.completions.create.return_value = _FAKE_RESPONSE
 
         # Act
-        llm.complete("Test prompt")
+        default_llm.complete("Test prompt")
 
         # Assert - Gradient client was created with user agent params
-        call_kwargs = mock_gradient_class.call_args.kwargs
-        assert call_kwargs["user_agent_package"] == PACKAGE_NAME
-        assert call_kwargs["user_agent_version"] == PACKAGE_VERSION
+        call_kwargs = gradient_factory.calls[-1]
+        _assert_ua(call_kwargs)
 
-    @patch("llama_index.llms.digitalocean.gradientai.base.Gradient")
-    def test_user_agent_passed_during_chat(self, mock_gradient_class):
+    def test_user_agent_passed_during_chat(self, patched_gradient, default_llm):
         """Test that user agent is configured when chat() is called."""
-        from llama_index.core.base.llms.types import ChatMessage
-
+        gradient_factory, _ = patched_gradient
         # Arrange
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Test response"
-        mock_response.choices[0].message.role = "assistant"
-        mock_response.choices[0].message.tool_calls = None
-
-        mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_gradient_class.return_value = mock_client
-
-        llm = GradientAI(
-            model="test-model",
-            model_access_key="test-key",
-        )
+        gradient_factory.client.chat.completions.create.return_value = _FAKE_RESPONSE
 
         # Act
-        llm.chat([ChatMessage(role="user", content="Hello")])
+        default_llm.chat([ChatMessage(role="user", content="Hello")])
 
         # Assert - Gradient client was created with user agent params
-        call_kwargs = mock_gradient_class.call_args.kwargs
-        assert call_kwargs["user_agent_package"] == PACKAGE_NAME
-        assert call_kwargs["user_agent_version"] == PACKAGE_VERSION
-
-    @patch("llama_index.llms.digitalocean.gradientai.base.AsyncGradient")
-    @pytest.mark.asyncio
-    async def test_user_agent_passed_during_acomplete(self, mock_async_gradient_class):
-        """Test that user agent is configured when acomplete() is called."""
-        # Arrange
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Test async response"
-
-        mock_client = MagicMock()
-        # Make the create method return an awaitable
-        mock_client.chat.completions.create = MagicMock(return_value=mock_response)
-
-        # We need to mock the async call properly
-        async def mock_create(**kwargs):
-            return mock_response
+        call_kwargs = gradient_factory.calls[-1]
+        _assert_ua(call_kwargs)
 
-        mock_client.chat.completions.create = mock_create
-        mock_async_gradient_class.return_value = mock_client
-
-        llm = GradientAI(
-            model="test-model",
-            model_access_key="test-key",
-        )
+    async def test_user_agent_passed_during_acomplete(self, patched_gradient, default_llm):
+        """Test that acomplete() reuses one AsyncGradient client configured with user agent."""
+        _, async_gradient_factory = patched_gradient
+        # Arrange
+        async_gradient_factory.client.chat.completions.create = _fake_create
 
-        # Act
-        await llm.acomplete("Test async prompt")
+        # Act - call twice to exercise the cached async client
+        first = await default_llm.acomplete("Test async prompt")
+        second = await default_llm.acomplete("Test async prompt")
 
-        # Assert - AsyncGradient client was created with user agent params
-        call_kwargs = mock_async_gradient_class.call_args.kwargs
-        assert call_kwargs["user_agent_package"] == PACKAGE_NAME
-        assert call_kwargs["user_agent_version"] == PACKAGE_VERSION
+        # Assert - AsyncGradient client was created once with user agent params
+        assert first.text == second.text == "Test response"
+        assert len(async_gradient_factory.calls) == 1
+        _assert_ua(async_gradient_factory.calls[0])
 
 
 class TestUserAgentConsistency:
     """Tests verifying consistent user agent between sync and async clients."""
 
-    @patch("llama_index.llms.digitalocean.gradientai.base.AsyncGradient")
-    @patch("llama_index.llms.digitalocean.gradientai.base.Gradient")
-    def test_sync_and_async_clients_have_same_user_agent(
-        self, mock_gradient_class, mock_async_gradient_class
-    ):
-        """Test that both sync and async clients receive identical user agent info."""
-        # Arrange
-        mock_gradient_class.return_value = MagicMock()
-        mock_async_gradient_class.return_value = MagicMock()
+    def test_sync_and_async_clients_have_same_user_agent(self, patched_gradient, default_llm):
+        """Test that both sync and async clients are built from the same settings."""
+        gradient_factory, async_gradient_factory = patched_gradient
 
-        llm = GradientAI(
-            model="test-model",
-            model_access_key="test-key",
-        )
+        _ = default_llm._client
+        _ = default_llm._async_client
 
-        # Act - access both clients
-        _ = llm._client
-        _ = llm._async_client
-
-        # Assert
-        sync_kwargs = mock_gradient_class.call_args.kwargs
-        async_kwargs = mock_async_gradient_class.call_args.kwargs
-
-        # Both should have the same user agent package
-        assert sync_kwargs["user_agent_package"] == async_kwargs["user_agent_package"]
-        assert sync_kwargs["user_agent_package"] == PACKAGE_NAME
-
-        # Both should have the same user agent version
-        assert sync_kwargs["user_agent_version"] == async_kwargs["user_agent_version"]
-        assert sync_kwargs["user_agent_version"] == PACKAGE_VERSION
+        expected = default_llm._get_client_kwargs()
+        assert gradient_factory.calls[0] == expected
+        assert async_gradient_factory.calls[0] == expected
+        _assert_ua(expected)
 
     def test_user_agent_constants_are_exported(self):
         """Test that user agent constants can be imported from the base module."""
-        from llama_index.llms.digitalocean.gradientai.base import (
-            PACKAGE_NAME,
-            PACKAGE_VERSION,
-        )
-
+        # The module-level import above already proves they are importable
         assert PACKAGE_NAME is not None
         assert PACKAGE_VERSION is not None
         assert isinstance(PACKAGE_NAME, str)